@@ -4,8 +4,18 @@ loctocat is the easiest way to add OAuth 2.0 device flow authentication to your
 https://loctocat.celsiusnarhwal.dev
 """
 
-from loctocat.auth import *
-from loctocat.exceptions import *
-from loctocat.predefined import *
+from loctocat.auth import AsyncAuthenticator, Authenticator, Handler, LoctocatAuthInfo
+from loctocat.exceptions import ServerError
+from loctocat.predefined import AsyncGitHubAuthenticator, GitHubAuthenticator
+
+__all__ = [
+    "Authenticator",
+    "AsyncAuthenticator",
+    "Handler",
+    "LoctocatAuthInfo",
+    "ServerError",
+    "GitHubAuthenticator",
+    "AsyncGitHubAuthenticator",
+]
 
 __version__ = "1.0.0"
@@ -1,13 +1,62 @@
 """
-Houses the :class:`_Spinner` class. This module is considered internal and should not be imported outside of the
-library.
+Houses the :class:`_Spinner` and :class:`_DotSpinner` classes. This module is considered internal and should not be
+imported outside of the library.
 """
 
 from __future__ import annotations
 
-from typing import Union
+import sys
+from typing import TYPE_CHECKING, Union
 
-from halo import Halo
+if TYPE_CHECKING:
+    from halo import Halo
+
+
+class _DotSpinner:
+    """
+    A threadless stand-in for :class:`halo.Halo` that prints a dot to standard error each time it's ticked. This class
+    is considered internal and should not be imported outside of the library.
+    """
+    def __init__(self, text: str):
+        self.text = text
+        self._running = False
+
+    def start(self):
+        if not self._running:
+            self._running = True
+            self._write(self.text)
+
+        return self
+
+    def tick(self):
+        if self._running:
+            self._write(".")
+
+        return self
+
+    def stop(self):
+        if self._running:
+            self._running = False
+            self._write("\n")
+
+        return self
+
+    def succeed(self, text: str = None):
+        return self._stop_and_persist("✔", text)
+
+    def fail(self, text: str = None):
+        return self._stop_and_persist("✖", text)
+
+    def _stop_and_persist(self, symbol: str, text: str = None):
+        self.stop()
+        self._write(f"{symbol} {text or self.text}\n")
+
+        return self
+
+    @staticmethod
+    def _write(text: str):
+        sys.stderr.write(text)
+        sys.stderr.flush()
 
 
 class _Spinner:
@@ -15,31 +64,22 @@ class _Spinner:
     A wrapper around :class:`halo.Halo`. This class is considered internal and should not be imported outside of the
     library.
     """
-    def __init__(self, spinner: Union[Halo, None]):
+    def __init__(self, spinner: Union[Halo, _DotSpinner, None]):
         self.spinner = spinner
 
-    @staticmethod
-    def spin_condition(func):
-        def wrapper(spinner, *args, **kwargs):
-            if spinner.spinner:
-                return func(spinner, *args, **kwargs)
-            else:
-                return spinner
-
-        return wrapper
+        if spinner:
+            self.succeed = spinner.succeed
+            self.fail = spinner.fail
+            self.tick = getattr(spinner, "tick", lambda: self)
+        else:
+            self.succeed = self.fail = self.tick = lambda *args, **kwargs: self
 
-    @spin_condition
     def __enter__(self):
-        return self.spinner.start()
+        if self.spinner:
+            self.spinner.start()
 
-    @spin_condition
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.spinner.stop()
+        return self
 
-    @spin_condition
-    def succeed(self):
-        self.spinner.succeed()
-
-    @spin_condition
-    def fail(self):
-        self.spinner.fail()
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.spinner:
+            self.spinner.stop()
@@ -4,20 +4,91 @@ Core classes for OAuth 2.0 device flow authentication.
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import math
+import random
+import socket
+import sys
+import threading
 import time
-from typing import Callable
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable
+from urllib.parse import urlparse
 
-import aiohttp
 import requests
-from halo import Halo
 from oauthlib.oauth2 import DeviceClient
-from termcolor import colored
 
-from loctocat._spinner import _Spinner
+from loctocat._spinner import _DotSpinner, _Spinner
 from loctocat.exceptions import *
 
+if TYPE_CHECKING:
+    import aiohttp
+    from halo import Halo
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 __all__ = ["Authenticator", "AsyncAuthenticator", "Handler", "LoctocatAuthInfo"]
 
+_HEADERS = {"Accept": "application/json"}
+_TIMEOUT = 30
+_MAX_POLL_INTERVAL = 60
+
+
+def _is_transient(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def _resolve_quietly(host: str, port: int):
+    try:
+        socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (OSError, UnicodeError):
+        pass
+
+
+async def _resolve_quietly_async(host: str, port: int):
+    try:
+        await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (OSError, UnicodeError):
+        pass
+
+
+def _parse_retry_after(value: str) -> float | None:
+    if not value:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    if not math.isfinite(delay):
+        return None
+
+    return max(delay, 0)
+
+
+def _retry_delay(backoff: float, retry_after: str, deadline: float) -> float:
+    """
+    Return the number of seconds to wait before retrying a failed request: the server's Retry-After value if it sent a
+    usable one, otherwise the backoff plus jitter, capped at the maximum poll interval. Either way, the wait never runs
+    past the deadline.
+    """
+    delay = _parse_retry_after(retry_after)
+
+    if delay is None:
+        delay = min(backoff + random.uniform(0, 1), _MAX_POLL_INTERVAL)
+
+    return max(min(delay, deadline - time.monotonic()), 0)
+
 
 class Handler:
     """
@@ -29,7 +100,8 @@ class Handler:
         The error code returned by the authorization server.
     action: Callable[[Authenticator], None]
         The function to be called when the error code is returned. The function
-        must take an class:`Authenticator` object as its only parameter.
+        must take an class:`Authenticator` object as its only parameter. Handlers
+        attached to an :class:`AsyncAuthenticator` may also be coroutine functions.
     continue_on_error: bool, optional
         Whether to continue the authentication process after the handler is
         called. Defaults to True.
@@ -41,9 +113,10 @@ class Handler:
         self.continue_on_error = continue_on_error
 
 
+@dataclass(frozen=True)
 class LoctocatAuthInfo:
     """
-    A set of information returned by an authorization server.
+    A set of information returned by an authorization server. Its attributes are read-only.
 
     Parameters
     ----------
@@ -51,27 +124,47 @@ class LoctocatAuthInfo:
         The device code.
     user_code: str
         The user code. This is the code the user must use to authorize your app.
-    verificiation_uri: str
+    verification_uri: str
         The URL the user must visit to authorize your app.
     expires_in: int
         The number of seconds for which the device code is valid.
-    interval: int
+    interval: float
         The minimum number of seconds your app must wait between polling requests.
     """
-    __slots__ = ["device_code", "user_code", "verification_uri", "expires_in", "interval"]
+    __slots__ = ("device_code", "user_code", "verification_uri", "expires_in", "interval")
 
-    def __init__(self, device_code, user_code, verificiation_uri, expires_in, interval):
-        self.device_code = device_code
-        self.user_code = user_code
-        self.verification_uri = verificiation_uri
-        self.expires_in = expires_in
-        self.interval = interval
+    device_code: str
+    user_code: str
+    verification_uri: str
+    expires_in: int
+    interval: float
+
+    # Slotted frozen dataclasses can't be pickled or copied without these; dataclass(slots=True) would generate them,
+    # but it requires Python 3.10.
+    def __getstate__(self):
+        return [getattr(self, field.name) for field in fields(self)]
+
+    def __setstate__(self, state):
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
 
 
 class Authenticator:
     """
     A class for authenticating with OAuth 2.0 APIs using the device flow.
 
+    An Authenticator reuses a single HTTP session for all of its requests. The session is created on first use and
+    closed when the Authenticator is used as a context manager:
+
+    .. code-block:: python
+
+        with Authenticator(client_id, auth_url, token_url) as authenticator:
+            authenticator.ping()
+            token = authenticator.poll()
+
+    :meth:`authenticate` does this for you. If you call :meth:`ping` and :meth:`poll` outside of a ``with`` block,
+    call :meth:`close` when you're done. Sessions you pass in are never closed by the Authenticator.
+
     Parameters
     ----------
     client_id: str
@@ -86,12 +179,15 @@ class Authenticator:
         A list of scopes your app will request access to. Defaults to None.
     poll_interval: int, optional
         The number of seconds your app will wait between polling requests. Defaults to 5.
+    session: requests.Session, optional
+        The session to use for requests to the authorization server. Defaults to None, in which case the Authenticator
+        creates its own on first use.
     extras: keyword arguments, optional
         Any additional parameters required by the authorization server.
     """
 
     def __init__(self, client_id: str, auth_url: str, token_url: str, scopes: list[str] = None, poll_interval: int = 5,
-                 **extras):
+                 session: requests.Session = None, **extras):
         self.client_id = client_id
         self.auth_url = auth_url
         self.token_url = token_url
@@ -100,7 +196,14 @@ class Authenticator:
 
         self.auth_info: LoctocatAuthInfo = None
 
-        self._handlers = []
+        self._http = session
+        self._owns_session = session is None
+        self._retry_after: str = None
+        self._deadline: float = None
+        self._bold_user_code: str = None
+        self._token_request_uri: tuple[str, str] = None
+        self._spinner: _Spinner = _Spinner(None)
+        self._handlers: dict[str, Handler] = {}
         self._dc = DeviceClient(client_id=self.client_id, scope=self.scopes, **extras)
 
         for handler in self._get_default_handlers():
@@ -109,7 +212,8 @@ class Authenticator:
     def authenticate(self,
                      use_default_message: bool = True, message: str = None,
                      use_default_success_message: bool = True, success_message: str = None,
-                     use_default_spinner: bool = True, spinner: Halo = None) -> str:
+                     use_default_spinner: bool = True, spinner: Halo = None,
+                     lightweight_spinner: bool = False) -> str:
         """
         Authenticate with the authorization server.
 
@@ -126,38 +230,58 @@ class Authenticator:
             The message to display to the user upon successful authentication. Defaults to None. If a truthy value is
             provided, it will override the default success message even if use_default_success_message is True.
         use_default_spinner: bool, optional
-            Whether to use the default spinner. See the spinner parameter. Defaults to True.
+            Whether to use the default spinner. See the spinner parameter. Defaults to True. The default spinner is
+            never shown when standard output isn't a terminal.
         spinner: Halo, optional
             The Halo spinner to display while waiting for the user to authorize your app. Defaults to None. If a truthy
             value is provided, it will override the default spinner even if use_default_spinner is True.
+        lightweight_spinner: bool, optional
+            Whether the default spinner should be a line of dots, printed to standard error once per polling request,
+            instead of an animated Halo spinner. Unlike the Halo spinner, it's shown even when standard output isn't a
+            terminal. Defaults to False.
 
         Returns
         -------
         str
             The access token returned by the authorization server.
         """
-        self.ping()
+        with self:
+            self.ping()
+            self._announce(use_default_message, message)
+            spinner = self._build_default_spinner(use_default_spinner, spinner, lightweight_spinner)
 
-        if use_default_message and not message:
-            print(f"Go to {self.auth_info.verification_uri} and enter code "
-                  f"{colored(self.auth_info.user_code, attrs=['bold'])} to authenticate.")
-        elif message:
-            print(message)
+            with _Spinner(spinner) as self._spinner:
+                token = self.poll()
+                self._succeed(self._spinner, use_default_success_message, success_message)
 
-        if use_default_spinner and not spinner:
-            spinner = Halo(text="Waiting for authentication...", spinner="dots")
+                return token
 
-        with _Spinner(spinner) as sp:
-            token = self.poll()
+    def __enter__(self) -> Authenticator:
+        return self
 
-            if use_default_success_message and not success_message:
-                sp.succeed("Authentication successful!")
-            elif success_message:
-                sp.succeed(success_message)
-            else:
-                sp.succeed()
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
-            return token
+    @property
+    def _session(self) -> requests.Session:
+        if self._http is None:
+            self._http = requests.Session()
+            self._owns_session = True
+
+        return self._http
+
+    def close(self):
+        """
+        Close the Authenticator's HTTP session, unless it was passed in by you. A new session will be created if the
+        Authenticator is used again.
+        """
+        if not self._owns_session:
+            return
+
+        if self._http is not None:
+            self._http.close()
+
+        self._http = None
 
     def ping(self) -> LoctocatAuthInfo:
         """
@@ -169,17 +293,12 @@ class Authenticator:
             A LocotocatAuthInfo object containing the information returned by the authorization server.
         """
         uri = self._dc.prepare_request_uri(self.auth_url)
-        response = requests.post(uri, headers={"Accept": "application/json"}).json()
-
-        auth_info = LoctocatAuthInfo(
-            device_code=response["device_code"],
-            user_code=response["user_code"],
-            verificiation_uri=response.get("verification_uri") or response.get("verification_url"),
-            expires_in=response["expires_in"],
-            interval=response["interval"],
-        )
+        response = _loads(self._session.post(uri, headers=_HEADERS, timeout=_TIMEOUT).content)
+        auth_info = self._set_auth_info(response)
 
-        self.auth_info = auth_info
+        token_address = self._get_token_address()
+        if token_address:
+            threading.Thread(target=_resolve_quietly, args=token_address, daemon=True).start()
 
         return auth_info
 
@@ -192,13 +311,33 @@ class Authenticator:
         str
             The access token returned by the authorization server.
         """
-        uri = self._dc.prepare_request_uri(self.token_url, device_code=self.auth_info.device_code)
+        uri = self._get_token_request_uri()
+        session = self._session
+        deadline = self._deadline = time.monotonic() + self.auth_info.expires_in
+        backoff = self.poll_interval
 
         while True:
-            response = requests.post(uri, headers={"Accept": "application/json"}).json()
+            try:
+                response = session.post(uri, headers=_HEADERS, timeout=_TIMEOUT)
+                if _is_transient(response.status_code):
+                    response.raise_for_status()
+            except requests.exceptions.SSLError:
+                raise
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                if time.monotonic() >= deadline:
+                    raise
+
+                backoff = min(backoff * 2, _MAX_POLL_INTERVAL)
+                retry_after = e.response.headers.get("Retry-After") if e.response is not None else None
+                time.sleep(_retry_delay(backoff, retry_after, deadline))
+                continue
+
+            backoff = self.poll_interval
+            self._retry_after = response.headers.get("Retry-After")
+            response = _loads(response.content)
 
             if "error" in response:
-                handler: Handler = next((h for h in self._handlers if h.error == response["error"]), None)
+                handler = self._handlers.get(response["error"])
                 if handler:
                     handler.action(self)
                     if handler.continue_on_error:
@@ -220,12 +359,23 @@ class Authenticator:
         handler: Handler
             The handler to attach.
         """
-        try:
-            self._handlers.remove(next(h for h in self._handlers if h.error == handler.error))
-        except StopIteration:
-            pass
+        self._handlers[handler.error] = handler
+
+    def _slow_down(self):
+        """
+        Increase the poll interval exponentially, with jitter, in response to a slow_down error. If the server sent a
+        Retry-After header, its value is used instead, as long as it doesn't run past the deadline. The poll interval
+        never decreases.
+        """
+        delay = _parse_retry_after(self._retry_after)
+
+        if delay is None:
+            delay = min(self.poll_interval * 2 + random.uniform(0, 1), _MAX_POLL_INTERVAL)
+        elif self._deadline is not None:
+            delay = min(delay, max(self._deadline - time.monotonic(), 0))
 
-        self._handlers.append(handler)
+        # RFC 8628 § 3.5: the interval must grow by at least 5 seconds for this and all subsequent requests.
+        self.poll_interval = max(delay, self.poll_interval + 5)
 
     def get_handlers(self) -> list[Handler]:
         """
@@ -236,25 +386,176 @@ class Authenticator:
         list[Handler]
             A list of all handlers currently attached to the Authenticator.
         """
-        return self._handlers
+        return list(self._handlers.values())
+
+    def _get_token_request_uri(self) -> str:
+        device_code = self.auth_info.device_code
+
+        if self._token_request_uri is None or self._token_request_uri[0] != device_code:
+            uri = self._dc.prepare_request_uri(self.token_url, device_code=device_code)
+            self._token_request_uri = (device_code, uri)
+
+        return self._token_request_uri[1]
+
+    def _get_token_address(self) -> tuple[str, int] | None:
+        # Warming the resolver only helps if polling goes to a different host than ping did. Otherwise, the
+        # connection ping opened is already sitting in the session's pool.
+        token_url, auth_url = urlparse(self.token_url), urlparse(self.auth_url)
+
+        if not token_url.hostname or token_url.netloc == auth_url.netloc:
+            return None
+
+        return token_url.hostname, token_url.port or (443 if token_url.scheme == "https" else 80)
+
+    def _set_auth_info(self, response: dict) -> LoctocatAuthInfo:
+        # Some servers (e.g. Google) say verification_url instead of verification_uri.
+        response["verification_uri"] = response.pop("verification_uri", None) or response.pop("verification_url", None)
+
+        self.auth_info = LoctocatAuthInfo(
+            device_code=response["device_code"],
+            user_code=response["user_code"],
+            verification_uri=response["verification_uri"],
+            expires_in=response["expires_in"],
+            interval=float(response["interval"]),
+        )
+        self._bold_user_code = None
+
+        return self.auth_info
+
+    def _announce(self, use_default_message: bool, message: str):
+        if use_default_message and not message:
+            if self._bold_user_code is None:
+                from termcolor import colored
+
+                self._bold_user_code = colored(self.auth_info.user_code, attrs=["bold"])
+
+            print(f"Go to {self.auth_info.verification_uri} and enter code {self._bold_user_code} to authenticate.")
+        elif message:
+            print(message)
+
+    @staticmethod
+    def _build_default_spinner(use_default_spinner: bool, spinner: Halo, lightweight_spinner: bool) -> Halo:
+        if use_default_spinner and not spinner and lightweight_spinner:
+            spinner = _DotSpinner("Waiting for authentication...")
+        elif use_default_spinner and not spinner and sys.stdout.isatty():
+            from halo import Halo
+
+            spinner = Halo(text="Waiting for authentication...", spinner="dots")
+
+        return spinner
+
+    @staticmethod
+    def _succeed(sp: _Spinner, use_default_success_message: bool, success_message: str):
+        if use_default_success_message and not success_message:
+            sp.succeed("Authentication successful!")
+        elif success_message:
+            sp.succeed(success_message)
+        else:
+            sp.succeed()
 
     @staticmethod
     def _get_default_handlers():
+        def wait(ctx: Authenticator):
+            ctx._spinner.tick()
+            time.sleep(max(ctx.auth_info.interval, ctx.poll_interval))
+
+        def slow_down(ctx: Authenticator):
+            ctx._slow_down()
+            wait(ctx)
+
         return [
-            Handler("authorization_pending", lambda ctx: time.sleep(ctx.auth_info.interval)),
-            Handler("slow_down", lambda ctx: ctx.poll_interval == ctx.poll_interval + 5),
+            Handler("authorization_pending", wait),
+            Handler("slow_down", slow_down),
         ]
 
 
 class AsyncAuthenticator(Authenticator):
     """
     A class for asynchronously authenticating with OAuth 2.0 APIs using the device flow.
+
+    An AsyncAuthenticator reuses a single HTTP session for all of its requests. The session is created on first use
+    and closed when the AsyncAuthenticator is used as an asynchronous context manager:
+
+    .. code-block:: python
+
+        async with AsyncAuthenticator(client_id, auth_url, token_url) as authenticator:
+            await authenticator.ping()
+            token = await authenticator.poll()
+
+    :meth:`authenticate` does this for you. If you call :meth:`ping` and :meth:`poll` outside of an ``async with``
+    block, call :meth:`close` when you're done.
+
+    To share a connection pool between several AsyncAuthenticators, pass them the same session. Sessions you pass in
+    are never closed by the AsyncAuthenticator.
+
+    Parameters
+    ----------
+    client_id: str
+        Your app's client ID.
+    auth_url: str
+        The URL from which your app will request device and user codes.
+    token_url: str
+        The URL which your app with poll for an authorization token.
+    scopes: list[str], optional
+        A list of scopes your app will request access to. Defaults to None.
+    poll_interval: int, optional
+        The number of seconds your app will wait between polling requests. Defaults to 5.
+    session: aiohttp.ClientSession, optional
+        The session to use for requests to the authorization server. Defaults to None, in which case the
+        AsyncAuthenticator creates its own on first use.
+    extras: keyword arguments, optional
+        Any additional parameters required by the authorization server.
     """
 
+    def __init__(self, client_id: str, auth_url: str, token_url: str, scopes: list[str] = None, poll_interval: int = 5,
+                 session: aiohttp.ClientSession = None, **extras):
+        super().__init__(client_id, auth_url, token_url, scopes, poll_interval, session, **extras)
+        self._dns_warmup: asyncio.Task = None
+
+    def __enter__(self):
+        raise TypeError("AsyncAuthenticator must be used with 'async with', not 'with'")
+
+    async def __aenter__(self) -> AsyncAuthenticator:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def _session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            import aiohttp
+
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=75),
+            )
+            self._owns_session = True
+
+        return self._http
+
+    async def close(self):
+        """
+        Close the AsyncAuthenticator's HTTP session, unless it was passed in by you, and cancel any DNS lookup still in
+        flight. A new session will be created if the AsyncAuthenticator is used again.
+        """
+        if self._dns_warmup is not None:
+            self._dns_warmup.cancel()
+            await asyncio.gather(self._dns_warmup, return_exceptions=True)
+            self._dns_warmup = None
+
+        if not self._owns_session:
+            return
+
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+
+        self._http = None
+
     async def authenticate(self,
                            use_default_message: bool = True, message: str = None,
                            use_default_success_message: bool = True, success_message: str = None,
-                           use_default_spinner: bool = True, spinner: Halo = None) -> str:
+                           use_default_spinner: bool = True, spinner: Halo = None,
+                           lightweight_spinner: bool = False) -> str:
         """
         Authenticate with the authorization server.
 
@@ -271,38 +572,31 @@ class AsyncAuthenticator(Authenticator):
             The message to display to the user upon succesful authentication. Defaults to None. If a truthy value is
             provided, it will override the default success message even if use_default_success_message is True.
         use_default_spinner: bool, optional
-            Whether to use the default spinner. See the spinner parameter. Defaults to True.
+            Whether to use the default spinner. See the spinner parameter. Defaults to True. The default spinner is
+            never shown when standard output isn't a terminal.
         spinner: Halo, optional
             The Halo spinner to display while waiting for the user to authorize your app. Defaults to None. If a truthy
             value is provided, it will override the default spinner even if use_default_spinner is True.
+        lightweight_spinner: bool, optional
+            Whether the default spinner should be a line of dots, printed to standard error once per polling request,
+            instead of an animated Halo spinner. Unlike the Halo spinner, it's shown even when standard output isn't a
+            terminal. Defaults to False.
 
         Returns
         -------
         str
             The access token returned by the authorization server.
         """
-        await self.ping()
-
-        if use_default_message and not message:
-            print(f"Go to {self.auth_info.verification_uri} and enter code "
-                  f"{colored(self.auth_info.user_code, attrs=['bold'])} to authenticate.")
-        elif message:
-            print(message)
-
-        if use_default_spinner and not spinner:
-            spinner = Halo(text="Waiting for authentication...", spinner="dots")
-
-        with _Spinner(spinner) as sp:
-            token = await self.poll()
+        async with self:
+            await self.ping()
+            self._announce(use_default_message, message)
+            spinner = self._build_default_spinner(use_default_spinner, spinner, lightweight_spinner)
 
-            if use_default_success_message and not success_message:
-                sp.succeed("Authentication successful!")
-            elif success_message:
-                sp.succeed(success_message)
-            else:
-                sp.succeed()
+            with _Spinner(spinner) as self._spinner:
+                token = await self.poll()
+                self._succeed(self._spinner, use_default_success_message, success_message)
 
-            return token
+                return token
 
     async def ping(self) -> LoctocatAuthInfo:
         """
@@ -313,21 +607,20 @@ class AsyncAuthenticator(Authenticator):
         LoctocatAuthInfo
             A LocotocatAuthInfo object containing the information returned by the authorization server.
         """
+        import aiohttp
+
         uri = self._dc.prepare_request_uri(self.auth_url)
+        timeout = aiohttp.ClientTimeout(total=_TIMEOUT)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(uri, headers={"Accept": "application/json"}) as response:
-                response = await response.json()
+        async with self._session.post(uri, headers=_HEADERS, timeout=timeout) as response:
+            response = _loads(await response.read())
 
-        auth_info = LoctocatAuthInfo(
-            device_code=response["device_code"],
-            user_code=response["user_code"],
-            verificiation_uri=response.get("verification_uri") or response.get("verification_url"),
-            expires_in=response["expires_in"],
-            interval=response["interval"],
-        )
+        auth_info = self._set_auth_info(response)
 
-        self.auth_info = auth_info
+        token_address = self._get_token_address()
+        if token_address:
+            # Keep a reference so the task isn't garbage collected before it finishes.
+            self._dns_warmup = asyncio.get_running_loop().create_task(_resolve_quietly_async(*token_address))
 
         return auth_info
 
@@ -340,18 +633,64 @@ class AsyncAuthenticator(Authenticator):
         str
             The access token returned by the authorization server.
         """
-        uri = self._dc.prepare_request_uri(self.token_url, device_code=self.auth_info.device_code)
+        import aiohttp
+
+        uri = self._get_token_request_uri()
+        timeout = aiohttp.ClientTimeout(total=_TIMEOUT)
+        session = self._session
+        deadline = self._deadline = time.monotonic() + self.auth_info.expires_in
+        backoff = self.poll_interval
 
         while True:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(uri, headers={"Accept": "application/json"}) as response:
-                    response = await response.json()
+            retry_after = None
+
+            try:
+                async with session.post(uri, headers=_HEADERS, timeout=timeout) as response:
+                    retry_after = response.headers.get("Retry-After")
+                    if _is_transient(response.status):
+                        response.raise_for_status()
+
+                    response = _loads(await response.read())
+            except (aiohttp.ClientSSLError, aiohttp.TooManyRedirects):
+                raise
+            except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError):
+                if time.monotonic() >= deadline:
+                    raise
+
+                backoff = min(backoff * 2, _MAX_POLL_INTERVAL)
+                await asyncio.sleep(_retry_delay(backoff, retry_after, deadline))
+                continue
+
+            backoff = self.poll_interval
+            self._retry_after = retry_after
 
             if "error" in response:
-                handler: Handler = next((h for h in self._handlers if h.error == response["error"]), None)
+                handler = self._handlers.get(response["error"])
                 if handler:
-                    handler.action(self)
+                    result = handler.action(self)
+                    if inspect.isawaitable(result):
+                        await result
+
+                    if handler.continue_on_error:
+                        continue
+                    else:
+                        break
                 else:
-                    raise ServerError(f"The server returned the following error: {response['error']}")
+                    raise ServerError(response['error'])
             else:
                 return response["access_token"]
+
+    @staticmethod
+    def _get_default_handlers():
+        async def wait(ctx: AsyncAuthenticator):
+            ctx._spinner.tick()
+            await asyncio.sleep(max(ctx.auth_info.interval, ctx.poll_interval))
+
+        async def slow_down(ctx: AsyncAuthenticator):
+            ctx._slow_down()
+            await wait(ctx)
+
+        return [
+            Handler("authorization_pending", wait),
+            Handler("slow_down", slow_down),
+        ]
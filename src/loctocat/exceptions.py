@@ -8,4 +8,13 @@ __all__ = ["ServerError"]
 
 
 class ServerError(Exception):
-    pass
+    """
+    Raised when an authorization server returns an error for which no handler is attached. The error code is the
+    exception's first argument.
+    """
+
+    def __str__(self):
+        if not self.args:
+            return super().__str__()
+
+        return f"The server returned the following error: {self.args[0]}"
@@ -2,9 +2,19 @@
 Predefined authenticators for popular services.
 """
 
-from loctocat.auth import Authenticator
+from __future__ import annotations
 
-__all__ = ["GitHubAuthenticator"]
+from typing import TYPE_CHECKING
+
+from loctocat.auth import AsyncAuthenticator, Authenticator
+
+if TYPE_CHECKING:
+    import aiohttp
+
+__all__ = ["GitHubAuthenticator", "AsyncGitHubAuthenticator"]
+
+_GITHUB_AUTH_URL = "https://github.com/login/device/code"
+_GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
 
 
 class GitHubAuthenticator(Authenticator):
@@ -23,7 +33,37 @@ class GitHubAuthenticator(Authenticator):
         self.client_id = client_id
         self.scope = scopes
 
-        auth_url = "https://github.com/login/device/code"
-        token_url = "https://github.com/login/oauth/access_token"
+        super().__init__(client_id, _GITHUB_AUTH_URL, _GITHUB_TOKEN_URL, scopes)
+
+
+class AsyncGitHubAuthenticator(AsyncAuthenticator):
+    """
+    Asynchronously authenticate users with GitHub.
+
+    Many device flows can run concurrently on one event loop by sharing a session. Turn off the default spinner when
+    you do, since concurrent spinners would all draw over the same terminal line:
+
+    .. code-block:: python
+
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=64)) as session:
+            tokens = await asyncio.gather(
+                *(AsyncGitHubAuthenticator(client_id, session=session).authenticate(use_default_spinner=False)
+                  for client_id in client_ids)
+            )
+
+    Parameters
+    ----------
+    client_id : str
+        Your GitHub OAuth app's client ID.
+    scopes : list[str], optional
+        The scopes to request.
+    session : aiohttp.ClientSession, optional
+        The session to use for requests to GitHub. Defaults to None, in which case the AsyncGitHubAuthenticator
+        creates its own on first use.
+    """
+
+    def __init__(self, client_id: str, scopes: list[str] = None, session: aiohttp.ClientSession = None):
+        self.client_id = client_id
+        self.scope = scopes
 
-        super().__init__(client_id, auth_url, token_url, scopes)
+        super().__init__(client_id, _GITHUB_AUTH_URL, _GITHUB_TOKEN_URL, scopes, session=session)
@@ -0,0 +1,319 @@
+import asyncio
+import copy
+import pickle
+import time
+
+import aiohttp
+import pytest
+import requests
+
+from loctocat import AsyncAuthenticator, Authenticator, Handler, LoctocatAuthInfo
+from loctocat.auth import _MAX_POLL_INTERVAL, _parse_retry_after, _retry_delay
+
+TOKEN_URL = "https://example.com/token"
+
+
+class StubSession:
+    """Hands out canned responses (or raises canned exceptions) in order."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+
+    def post(self, uri, **kwargs):
+        result = self.results.pop(0)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def close(self):
+        pass
+
+
+def make_response(status: int = 200, body: bytes = b"{}", headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = TOKEN_URL
+
+    return response
+
+
+def pending() -> requests.Response:
+    return make_response(body=b'{"error": "authorization_pending"}')
+
+
+def slow_down(headers: dict = None) -> requests.Response:
+    return make_response(body=b'{"error": "slow_down"}', headers=headers)
+
+
+def token() -> requests.Response:
+    return make_response(body=b'{"access_token": "token"}')
+
+
+class AsyncStubResponse:
+    def __init__(self, status: int = 200, body: bytes = b"{}", headers: dict = None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status, headers=self.headers)
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class AsyncStubSession(StubSession):
+    closed = False
+
+    def post(self, uri, **kwargs):
+        result = self.results.pop(0)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return AsyncStubResponse(**result)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(time, "sleep", calls.append)
+
+    async def async_sleep(delay):
+        calls.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", async_sleep)
+    monkeypatch.setattr("random.uniform", lambda a, b: 0)
+
+    return calls
+
+
+def make_authenticator(session: StubSession, cls: type = Authenticator) -> Authenticator:
+    authenticator = cls("client_id", "https://example.com/device", TOKEN_URL, session=session)
+    authenticator._set_auth_info({
+        "device_code": "device_code",
+        "user_code": "user_code",
+        "verification_uri": "https://example.com/verify",
+        "expires_in": 900,
+        "interval": 5,
+    })
+
+    return authenticator
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("7", 7),
+    ("-3", 0),
+    ("garbage", None),
+    ("nan", None),
+    ("inf", None),
+    ("1e400", None),
+    ("Wed, 21 Oct 2015 07:28:00 GMT", 0),
+])
+def test_parse_retry_after(value, expected):
+    assert _parse_retry_after(value) == expected
+
+
+def test_retry_delay_is_clamped():
+    far = time.monotonic() + 900
+
+    assert _retry_delay(5, "120", far) == 120
+    assert 800 < _retry_delay(5, "86400", far) <= 900
+    assert _retry_delay(120, None, far) == _MAX_POLL_INTERVAL
+    assert _retry_delay(5, "nan", far) < _MAX_POLL_INTERVAL
+    assert _retry_delay(5, "86400", time.monotonic() + 2) <= 2
+    assert _retry_delay(5, None, time.monotonic() - 1) == 0
+
+
+def test_transient_failure_does_not_slow_down_pending_waits(sleeps):
+    authenticator = make_authenticator(StubSession(make_response(503), pending(), pending(), token()))
+
+    assert authenticator.poll() == "token"
+    assert sleeps == [10, 5, 5]
+    assert authenticator.poll_interval == 5
+
+
+def test_backoff_resets_after_success(sleeps):
+    session = StubSession(make_response(503), make_response(503), pending(), make_response(503), token())
+    authenticator = make_authenticator(session)
+
+    assert authenticator.poll() == "token"
+    assert sleeps == [10, 20, 5, 10]
+
+
+def test_slow_down_is_not_undone_by_retry_after(sleeps):
+    authenticator = make_authenticator(
+        StubSession(slow_down(), make_response(503, headers={"Retry-After": "1"}), pending(), token())
+    )
+
+    assert authenticator.poll() == "token"
+    assert authenticator.poll_interval == 10
+    assert sleeps == [10, 1, 10]
+
+
+def test_slow_down_honors_retry_after_but_grows_by_at_least_five_seconds(sleeps):
+    authenticator = make_authenticator(StubSession(slow_down({"Retry-After": "1"}), token()))
+
+    assert authenticator.poll() == "token"
+    assert authenticator.poll_interval == 10
+
+
+def test_slow_down_retry_after_is_not_capped_at_max_poll_interval(sleeps):
+    authenticator = make_authenticator(StubSession(slow_down({"Retry-After": "120"}), token()))
+
+    assert authenticator.poll() == "token"
+    assert authenticator.poll_interval == 120
+    assert sleeps == [120]
+
+
+def test_slow_down_retry_after_stops_at_deadline(sleeps):
+    authenticator = make_authenticator(StubSession(slow_down({"Retry-After": "86400"}), token()))
+
+    assert authenticator.poll() == "token"
+    assert 800 < authenticator.poll_interval <= 900
+
+
+@pytest.mark.parametrize("error", [
+    requests.exceptions.SSLError("certificate verify failed"),
+    requests.exceptions.InvalidURL("bad url"),
+    requests.exceptions.TooManyRedirects("loop"),
+])
+def test_permanent_errors_are_not_retried(sleeps, error):
+    authenticator = make_authenticator(StubSession(error, token()))
+
+    with pytest.raises(type(error)):
+        authenticator.poll()
+
+    assert sleeps == []
+
+
+def test_connection_errors_are_retried(sleeps):
+    authenticator = make_authenticator(StubSession(requests.ConnectionError("reset"), token()))
+
+    assert authenticator.poll() == "token"
+    assert sleeps == [10]
+    assert authenticator.poll_interval == 5
+
+
+def test_auth_info_can_be_copied_and_pickled():
+    auth_info = LoctocatAuthInfo("device_code", "user_code", "https://example.com/verify", 900, 5.0)
+
+    assert copy.copy(auth_info) == auth_info
+    assert copy.deepcopy(auth_info) == auth_info
+    assert pickle.loads(pickle.dumps(auth_info)) == auth_info
+    assert not hasattr(auth_info, "__dict__")
+
+
+def test_async_authenticator_rejects_sync_with():
+    authenticator = AsyncAuthenticator("client_id", "https://example.com/device", TOKEN_URL)
+
+    with pytest.raises(TypeError):
+        with authenticator:
+            pass
+
+
+def test_async_handler_can_stop_polling(sleeps):
+    session = AsyncStubSession({"body": b'{"error": "access_denied"}'}, {"body": b'{"access_token": "token"}'})
+    authenticator = make_authenticator(session, AsyncAuthenticator)
+    authenticator.attach_handler(Handler("access_denied", lambda ctx: None, continue_on_error=False))
+
+    assert asyncio.run(authenticator.poll()) is None
+    assert len(session.results) == 1
+
+
+def test_retry_after_on_transient_failure_is_not_capped_at_max_poll_interval(sleeps):
+    authenticator = make_authenticator(StubSession(make_response(429, headers={"Retry-After": "120"}), token()))
+
+    assert authenticator.poll() == "token"
+    assert sleeps == [120]
+    assert authenticator.poll_interval == 5
+
+
+def async_pending() -> dict:
+    return {"body": b'{"error": "authorization_pending"}'}
+
+
+def async_token() -> dict:
+    return {"body": b'{"access_token": "token"}'}
+
+
+def test_async_backoff_resets_after_success(sleeps):
+    session = AsyncStubSession({"status": 503}, {"status": 503}, async_pending(), {"status": 503}, async_token())
+    authenticator = make_authenticator(session, AsyncAuthenticator)
+
+    assert asyncio.run(authenticator.poll()) == "token"
+    assert sleeps == [10, 20, 5, 10]
+    assert authenticator.poll_interval == 5
+
+
+def test_async_retry_after_on_transient_failure(sleeps):
+    session = AsyncStubSession({"status": 503, "headers": {"Retry-After": "120"}}, async_token())
+    authenticator = make_authenticator(session, AsyncAuthenticator)
+
+    assert asyncio.run(authenticator.poll()) == "token"
+    assert sleeps == [120]
+    assert authenticator.poll_interval == 5
+
+
+@pytest.mark.parametrize("error", [
+    aiohttp.ClientSSLError(None, OSError(1, "certificate verify failed")),
+    aiohttp.TooManyRedirects(None, ()),
+])
+def test_async_permanent_errors_are_not_retried(sleeps, error):
+    authenticator = make_authenticator(AsyncStubSession(error, async_token()), AsyncAuthenticator)
+
+    with pytest.raises(type(error)):
+        asyncio.run(authenticator.poll())
+
+    assert sleeps == []
+
+
+def test_async_connection_errors_are_retried(sleeps):
+    session = AsyncStubSession(aiohttp.ServerDisconnectedError(), asyncio.TimeoutError(), async_token())
+    authenticator = make_authenticator(session, AsyncAuthenticator)
+
+    assert asyncio.run(authenticator.poll()) == "token"
+    assert sleeps == [10, 20]
+
+
+def test_async_slow_down_honors_retry_after(sleeps):
+    session = AsyncStubSession(
+        {"body": b'{"error": "slow_down"}', "headers": {"Retry-After": "1"}},
+        {"status": 503, "headers": {"Retry-After": "1"}},
+        async_pending(),
+        {"body": b'{"error": "slow_down"}', "headers": {"Retry-After": "120"}},
+        async_token(),
+    )
+    authenticator = make_authenticator(session, AsyncAuthenticator)
+
+    assert asyncio.run(authenticator.poll()) == "token"
+    assert sleeps == [10, 1, 10, 120]
+    assert authenticator.poll_interval == 120
+
+
+def test_async_close_cancels_dns_warmup():
+    async def main():
+        authenticator = make_authenticator(AsyncStubSession(), AsyncAuthenticator)
+        authenticator._dns_warmup = warmup = asyncio.get_running_loop().create_task(asyncio.Event().wait())
+
+        await authenticator.close()
+
+        return warmup, authenticator
+
+    warmup, authenticator = asyncio.run(main())
+
+    assert warmup.cancelled()
+    assert authenticator._dns_warmup is None